@@ -1,8 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-import wbgapi as wb
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(page_title="Indian Economic Monitor", page_icon="🇮🇳", layout="wide")
@@ -14,13 +16,10 @@ st.divider()
 # --- SIDEBAR NAVIGATION ---
 st.sidebar.header("Navigation")
 page = st.sidebar.radio("Select Module:", ["Real-Time Phillips Curve", "EXIM Trade Pulse"])
+refresh = st.sidebar.button("🔄 Refresh Data")
 
-# --- FUNCTION 1: PHILLIPS CURVE (World Bank) ---
-def real_phillips_curve():
-    st.header("📈 Macro-Stability: The Phillips Curve Analysis")
-    
-    # Introduction and Explanation
-    st.markdown("""
+# --- STATIC CONTENT ---
+_PHILLIPS_INTRO_MD = """
     ### What is the Phillips Curve?
     The **Phillips Curve** is a fundamental concept in macroeconomics that illustrates the inverse relationship 
     between inflation and unemployment. Named after economist A.W. Phillips, it suggests that:
@@ -29,106 +28,32 @@ def real_phillips_curve():
     - **Higher unemployment** → **Lower inflation** (economy is "cool")
     
     This relationship helps policymakers balance economic growth with price stability.
-    """)
-    
-    st.info("""
+    """
+
+_PHILLIPS_HOWTO_MD = """
     **💡 How to Read This Chart:**
     - Each **point** represents a specific year (2000-2023)
     - **X-axis:** Unemployment rate (% of labor force)
     - **Y-axis:** Inflation rate (% change in Consumer Price Index)
     - **Red dashed line:** Statistical trend showing the overall relationship
     - **Hover** over points to see the exact year and values
-    """)
-    
-    # 1. Fetch Data
-    with st.spinner('Querying World Bank API (Live Data)...'):
-        # Indicators: Inflation (FP.CPI.TOTL.ZG), Unemployment (SL.UEM.TOTL.ZS)
-        indicators = {'FP.CPI.TOTL.ZG': 'Inflation', 'SL.UEM.TOTL.ZS': 'Unemployment'}
-        df_list = []
-        
-        # We fetch data starting from 2000 to ensure better data quality
-        for ind, name in indicators.items():
-            try:
-                d = wb.data.DataFrame(ind, 'IND', time=range(2000, 2024)).T
-                d.columns = [name]
-                df_list.append(d)
-            except:
-                st.error(f"Could not retrieve data for {name}")
-                return
-        
-        # Data Cleaning
-        if not df_list:
-            st.error("API returned no data. Please check internet connection.")
-            return
+    """
 
-        final_df = pd.concat(df_list, axis=1)
-        # Cleaning the index (removing 'YR' prefix returned by API)
-        final_df.index = final_df.index.astype(str).str.replace('YR', '', regex=False).astype(int)
-        final_df.reset_index(inplace=True)
-        final_df.rename(columns={'index': 'Year'}, inplace=True)
-
-    # 2. Visualization
-    fig = px.scatter(
-        final_df, 
-        x="Unemployment", 
-        y="Inflation", 
-        hover_data=['Year'],
-        color="Year",
-        size_max=15,
-        title="Phillips Curve: India (2000-2023)",
-        labels={"Unemployment": "Unemployment Rate (%)", "Inflation": "Inflation (CPI %)"}
-    )
-    
-    # Add manual trendline using numpy polyfit
-    import numpy as np
-    # Remove NaN values for trendline calculation
-    clean_df = final_df.dropna(subset=['Unemployment', 'Inflation'])
-    if len(clean_df) > 1:
-        z = np.polyfit(clean_df['Unemployment'], clean_df['Inflation'], 1)
-        p = np.poly1d(z)
-        x_trend = np.linspace(clean_df['Unemployment'].min(), clean_df['Unemployment'].max(), 100)
-        y_trend = p(x_trend)
-        
-        fig.add_scatter(
-            x=x_trend, 
-            y=y_trend, 
-            mode='lines',
-            name='Trend Line',
-            line=dict(color='red', width=2, dash='dash')
-        )
-    
-    fig.update_traces(marker=dict(size=10, line=dict(width=1, color='white')))
-    fig.update_layout(
-        height=600,
-        font=dict(size=14),
-        hovermode='closest',
-        plot_bgcolor='rgba(240, 240, 240, 0.5)'
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # 3. Key Insights
-    st.markdown("### 🔍 Key Insights from India's Data")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
+_PHILLIPS_DATA_SHOWS_MD = """
         **📊 What the Data Shows:**
         - India's Phillips Curve shows a **weaker negative correlation** than classical theory predicts
         - Post-2015 data reveals a **flattening trend**, indicating structural changes in the economy
         - Inflation spikes (2008-2010) occurred despite varying unemployment levels
-        """)
-    
-    with col2:
-        st.markdown("""
+        """
+
+_PHILLIPS_INTERPRETATION_MD = """
         **🎯 Economic Interpretation:**
         - **Supply-side factors** (food, fuel prices) dominate inflation in India
         - **Structural unemployment** persists regardless of inflation levels
         - Traditional demand-management policies have limited effectiveness
-        """)
-    
-    # 3.5 Policy Implications
-    st.warning("""
+        """
+
+_PHILLIPS_POLICY_MD = """
     **🏛️ Policy Implications for India:**
     
     1. **Monetary Policy Limitations:** The Reserve Bank of India's interest rate adjustments alone may not 
@@ -140,26 +65,15 @@ def real_phillips_curve():
        - Infrastructure development to reduce logistics costs
     
     3. **Structural Reforms:** Address skill mismatches and labor market rigidities to reduce structural unemployment.
-    """)
-    
-    # 3.7 Show the data table
-    with st.expander("📋 View Raw Data Table"):
-        st.dataframe(final_df.sort_values('Year', ascending=False), use_container_width=True)
+    """
 
-    # 4. DATA SOURCES
-    with st.expander("📊 View Data Sources (Click to Open)"):
-        st.markdown("""
+_PHILLIPS_SOURCES_MD = """
         **Data fetched via World Bank API (wbgapi):**
         1.  **Inflation (Consumer Prices):** [World Bank Indicator FP.CPI.TOTL.ZG](https://data.worldbank.org/indicator/FP.CPI.TOTL.ZG?locations=IN)
         2.  **Unemployment (Total %):** [World Bank Indicator SL.UEM.TOTL.ZS](https://data.worldbank.org/indicator/SL.UEM.TOTL.ZS?locations=IN)
-        """)
+        """
 
-# --- FUNCTION 2: EXIM PULSE (RBI) ---
-def real_exim_pulse():
-    st.header("🚢 Trade Balance: Import/Export Composition")
-    
-    # Introduction and Explanation
-    st.markdown("""
+_EXIM_INTRO_MD = """
     ### Understanding India's Trade Flows
     
     This **Sankey diagram** visualizes India's major import and export categories, showing the flow of goods 
@@ -170,55 +84,181 @@ def real_exim_pulse():
     - **Exports** (🟢 Green): Goods India sells to other countries
     - **Trade Deficit**: When imports exceed exports (money flowing out)
     - **Trade Surplus**: When exports exceed imports (money flowing in)
-    """)
-    
-    st.info("""
+    """
+
+_EXIM_HOWTO_MD = """
     **💡 How to Read This Sankey Diagram:**
     - **Left side (Red):** Import categories flowing INTO India
     - **Center (Blue):** India 🇮🇳
     - **Right side (Green):** Export categories flowing FROM India
     - **Width of flows:** Proportional to trade value (in USD Billions)
     - **Hover** over flows to see exact values
-    """)
+    """
 
-    # 1. Load Data
-    try:
-        df = pd.read_csv('rbi_data.csv')
-    except FileNotFoundError:
-        st.error("⚠️ Data file not found. Please ensure 'rbi_data.csv' is in the folder.")
-        return
+_EXIM_STRENGTHS_MD = """
+    **✅ Strengths:**
+    - **Engineering Goods** ($107B) showcase India's manufacturing capabilities
+    - **Petroleum Products** ($94.5B) exports demonstrate refining capacity
+    - **Gems & Jewellery** ($38B) maintains traditional export strength
+    """
 
-    # 2. Process Data for Sankey with improved visuals
-    # Separate imports and exports
-    imports = df[df['Type'] == 'Import'].copy()
-    exports = df[df['Type'] == 'Export'].copy()
+_EXIM_VULN_MD = """
+    **⚠️ Vulnerabilities:**
+    - **Crude Oil** ($162.2B) imports create massive trade deficit and currency pressure
+    - **Electronic Goods** show dual nature: $73.5B imports vs $23.5B exports (net importer)
+    - **Gold** ($35B) imports for cultural/investment demand strain foreign reserves
+    """
+
+_EXIM_POLICY_MD = """
+    **🏛️ Policy Implications & Strategic Priorities:**
     
-    # Create labels with values for clarity
-    import_labels = [f"{row['Category']}" for _, row in imports.iterrows()]
-    export_labels = [f"{row['Category']}" for _, row in exports.iterrows()]
+    1. **Energy Security Crisis:**
+       - Crude oil imports ($162.2B) are the single largest trade burden
+       - **Action needed:** Accelerate renewable energy adoption, electric vehicle transition
+       - Target: Reduce oil import dependency by 30% by 2030
     
-    all_labels = import_labels + ["🇮🇳 INDIA"] + export_labels
+    2. **Electronics Manufacturing Opportunity:**
+       - Current net import of $50B in electronic goods
+       - **PLI Scheme Impact:** Growing domestic assembly (phones, semiconductors)
+       - **Goal:** Achieve electronics trade balance by 2027
     
-    sources = []
-    targets = []
-    values = []
-    link_colors = []
+    3. **Value Addition Strategy:**
+       - Export petroleum products ($94.5B) while importing crude ($162.2B)
+       - **Opportunity:** Expand refining capacity, petrochemical exports
+       - Leverage engineering goods strength for high-value manufacturing
     
-    india_index = len(import_labels)
+    4. **Current Account Management:**
+       - Trade deficit of $32B requires careful monitoring
+       - **Balance through:** Services exports (IT, consulting), remittances
+       - Maintain adequate foreign exchange reserves
+    """
+
+_EXIM_SOURCES_MD = """
+        **Data sourced from Reserve Bank of India (RBI):**
+        *   **Source Portal:** [RBI Database on Indian Economy (DBIE)](https://cims.rbi.org.in/)
+        *   **Specific Report:** Handbook of Statistics on the Indian Economy.
+        *   **Tables Used:** 
+            *   **Table 116:** Exports of Major Commodities.
+            *   **Table 118:** Imports of Major Commodities.
+        """
+
+# --- DATA LOADERS ---
+@st.cache_data(ttl=60 * 60 * 24, show_spinner="Querying World Bank API (Live Data)...")
+def _fetch_phillips_data() -> pd.DataFrame:
+    # Imported lazily so the EXIM page doesn't pay wbgapi's import cost
+    import wbgapi as wb
+
+    # Indicators: Inflation (FP.CPI.TOTL.ZG), Unemployment (SL.UEM.TOTL.ZS)
+    indicators = {'FP.CPI.TOTL.ZG': 'Inflation', 'SL.UEM.TOTL.ZS': 'Unemployment'}
+
+    def _fetch_indicator(item):
+        ind, name = item
+        try:
+            # Ask for years as the index directly, so no transpose is needed
+            d = wb.data.DataFrame(ind, 'IND', time=range(2000, 2024),
+                                  index='time', columns='series',
+                                  numericTimeKeys=True, skipBlanks=True)
+        except Exception as e:
+            # Raise instead of returning so a failed fetch is never cached
+            raise RuntimeError(f"Could not retrieve data for {name}") from e
+        # skipBlanks leaves no column at all for an indicator with no data
+        if ind not in d:
+            raise RuntimeError(f"Could not retrieve data for {name}")
+        return d[ind]
+
+    # We fetch data starting from 2000 to ensure better data quality.
+    # Both requests are network-bound, so run them concurrently.
+    with ThreadPoolExecutor(max_workers=len(indicators)) as executor:
+        series = dict(zip(indicators.values(), executor.map(_fetch_indicator, indicators.items())))
+
+    return pd.DataFrame(series).rename_axis('Year').reset_index()
+
+@st.cache_data
+def _load_rbi_data() -> pd.DataFrame:
+    # Static file, so parse it once and reuse it across reruns.
+    # Categorical labels turn the Type comparisons/groupby into int-code ops.
+    return pd.read_csv(
+        'rbi_data.csv',
+        dtype={'Type': 'category', 'Category': 'category'}
+    )
+
+# --- HELPERS ---
+def _trendline(x: np.ndarray, y: np.ndarray):
+    # Linear fit evaluated over 100 points spanning the observed x range
+    m, b = np.polyfit(x, y, 1)
+    x_trend = np.linspace(x.min(), x.max(), 100)
+    return x_trend, m * x_trend + b
+
+def _session_fig(name: str, build, *frames: pd.DataFrame) -> go.Figure:
+    # Session state is the figure cache: keep the last figure per chart, tagged
+    # with a fingerprint of the data it was built from, and rebuild only when
+    # that data changes
+    fingerprint = tuple(int(pd.util.hash_pandas_object(f).sum()) for f in frames)
+    key = f"fig::{name}"
+    stored = st.session_state.get(key)
+    if stored is None or stored[0] != fingerprint:
+        stored = st.session_state[key] = (fingerprint, build(*frames))
+    return stored[1]
+
+# --- FIGURE BUILDERS ---
+def _build_phillips_fig(final_df: pd.DataFrame) -> go.Figure:
+    fig = px.scatter(
+        final_df, 
+        x="Unemployment", 
+        y="Inflation", 
+        hover_data=['Year'],
+        color="Year",
+        size_max=15,
+        title="Phillips Curve: India (2000-2023)",
+        labels={"Unemployment": "Unemployment Rate (%)", "Inflation": "Inflation (CPI %)"},
+        render_mode='webgl'
+    )
+    
+    # Add manual trendline using numpy polyfit
+    # Remove NaN values for trendline calculation
+    clean_df = final_df.dropna(subset=['Unemployment', 'Inflation'])
+    if len(clean_df) > 1:
+        x_trend, y_trend = _trendline(
+            clean_df['Unemployment'].to_numpy(),
+            clean_df['Inflation'].to_numpy()
+        )
+        
+        fig.add_trace(go.Scattergl(
+            x=x_trend, 
+            y=y_trend, 
+            mode='lines',
+            name='Trend Line',
+            line=dict(color='red', width=2, dash='dash')
+        ))
     
-    # Import flows (to India)
-    for i, (_, row) in enumerate(imports.iterrows()):
-        sources.append(i)
-        targets.append(india_index)
-        values.append(row['Value'])
-        link_colors.append("rgba(239, 68, 68, 0.4)")  # Red for imports
+    fig.update_traces(marker=dict(size=10, line=dict(width=1, color='white')))
+    fig.update_layout(
+        height=600,
+        font=dict(size=14),
+        hovermode='closest',
+        plot_bgcolor='rgba(240, 240, 240, 0.5)'
+    )
+    return fig
+
+def _build_sankey_fig(imports: pd.DataFrame, exports: pd.DataFrame) -> go.Figure:
+    # Node labels are the category names themselves
+    import_labels = imports['Category'].tolist()
+    export_labels = exports['Category'].tolist()
+    
+    all_labels = import_labels + ["🇮🇳 INDIA"] + export_labels
     
-    # Export flows (from India)
-    for i, (_, row) in enumerate(exports.iterrows()):
-        sources.append(india_index)
-        targets.append(india_index + 1 + i)
-        values.append(row['Value'])
-        link_colors.append("rgba(34, 197, 94, 0.4)")  # Green for exports
+    n_imports = len(imports)
+    n_exports = len(exports)
+    india_index = n_imports
+    
+    # Import flows (to India) followed by export flows (from India)
+    sources = np.concatenate([np.arange(n_imports), np.full(n_exports, india_index)])
+    targets = np.concatenate([np.full(n_imports, india_index), india_index + 1 + np.arange(n_exports)])
+    values = np.concatenate([imports['Value'].to_numpy(), exports['Value'].to_numpy()])
+    link_colors = (
+        ["rgba(239, 68, 68, 0.4)"] * n_imports  # Red for imports
+        + ["rgba(34, 197, 94, 0.4)"] * n_exports  # Green for exports
+    )
     
     # Create node colors
     node_colors = [
@@ -229,7 +269,6 @@ def real_exim_pulse():
         "#16a34a" for _ in export_labels  # Green for export nodes
     ]
 
-    # 3. Plot Enhanced Sankey
     fig = go.Figure(data=[go.Sankey(
         node = dict(
           pad = 20,
@@ -257,12 +296,89 @@ def real_exim_pulse():
         height=700,
         margin=dict(l=20, r=20, t=80, b=20)
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+# --- FUNCTION 1: PHILLIPS CURVE (World Bank) ---
+def real_phillips_curve():
+    st.header("📈 Macro-Stability: The Phillips Curve Analysis")
+    
+    # Introduction and Explanation
+    st.markdown(_PHILLIPS_INTRO_MD)
+    
+    st.info(_PHILLIPS_HOWTO_MD)
+    
+    # 1. Fetch Data
+    try:
+        final_df = _fetch_phillips_data()
+    except RuntimeError as e:
+        st.error(str(e))
+        return
+
+    # Guard against a response with no year where both indicators are present
+    if final_df.dropna(subset=['Inflation', 'Unemployment']).empty:
+        st.error("API returned no data. Please check internet connection.")
+        return
+
+    # 2. Visualization
+    st.plotly_chart(_session_fig("phillips", _build_phillips_fig, final_df), use_container_width=True)
+    
+    # 3. Key Insights
+    st.markdown("### 🔍 Key Insights from India's Data")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_PHILLIPS_DATA_SHOWS_MD)
+    
+    with col2:
+        st.markdown(_PHILLIPS_INTERPRETATION_MD)
+    
+    # 3.5 Policy Implications
+    st.warning(_PHILLIPS_POLICY_MD)
+    
+    # 3.7 Show the data table
+    with st.expander("📋 View Raw Data Table"):
+        st.dataframe(final_df.sort_values('Year', ascending=False), use_container_width=True)
+
+    # 4. DATA SOURCES
+    with st.expander("📊 View Data Sources (Click to Open)"):
+        st.markdown(_PHILLIPS_SOURCES_MD)
+
+# --- FUNCTION 2: EXIM PULSE (RBI) ---
+def real_exim_pulse():
+    st.header("🚢 Trade Balance: Import/Export Composition")
+    
+    # Introduction and Explanation
+    st.markdown(_EXIM_INTRO_MD)
+    
+    st.info(_EXIM_HOWTO_MD)
+
+    # 1. Load Data
+    try:
+        df = _load_rbi_data()
+    except FileNotFoundError:
+        st.error("⚠️ Data file not found. Please ensure 'rbi_data.csv' is in the folder.")
+        return
+
+    # 2. Process Data for Sankey with improved visuals
+    # Group on Type once; the import/export split and the totals both come from it
+    by_type = df.groupby('Type', sort=False, observed=True)
+    groups = dict(tuple(by_type))
+    imports = groups.get('Import', df.iloc[0:0])
+    exports = groups.get('Export', df.iloc[0:0])
+    
+    # 3. Plot Enhanced Sankey
+    st.plotly_chart(_session_fig("sankey", _build_sankey_fig, imports, exports), use_container_width=True)
+    
+    # Sort each side once by value; the top-N and detail panels reuse these
+    imp_sorted = imports.sort_values('Value', ascending=False).reset_index(drop=True)
+    exp_sorted = exports.sort_values('Value', ascending=False).reset_index(drop=True)
     
     # 3.5 Add summary statistics
     col1, col2, col3 = st.columns(3)
-    total_imports = imports['Value'].sum()
-    total_exports = exports['Value'].sum()
+    totals = by_type['Value'].sum()
+    total_imports = float(totals.get('Import', 0.0))
+    total_exports = float(totals.get('Export', 0.0))
     trade_deficit = total_imports - total_exports
     
     with col1:
@@ -279,82 +395,53 @@ def real_exim_pulse():
     
     with col1:
         st.markdown("**🔴 Top Import Categories:**")
-        top_imports = imports.nlargest(3, 'Value')
-        for idx, row in top_imports.iterrows():
-            st.markdown(f"- **{row['Category']}**: ${row['Value']:.1f}B")
+        top_imports = imp_sorted.head(3)
+        st.markdown("\n".join(
+            f"- **{c}**: ${v:.1f}B"
+            for c, v in zip(top_imports['Category'].to_numpy(), top_imports['Value'].to_numpy())
+        ))
         st.caption("These represent India's key dependencies")
     
     with col2:
         st.markdown("**🟢 Top Export Categories:**")
-        top_exports = exports.nlargest(3, 'Value')
-        for idx, row in top_exports.iterrows():
-            st.markdown(f"- **{row['Category']}**: ${row['Value']:.1f}B")
+        top_exports = exp_sorted.head(3)
+        st.markdown("\n".join(
+            f"- **{c}**: ${v:.1f}B"
+            for c, v in zip(top_exports['Category'].to_numpy(), top_exports['Value'].to_numpy())
+        ))
         st.caption("These represent India's competitive strengths")
     
     # 4.5 Key Observations
     st.markdown("### 📊 Key Observations")
     
-    st.success("""
-    **✅ Strengths:**
-    - **Engineering Goods** ($107B) showcase India's manufacturing capabilities
-    - **Petroleum Products** ($94.5B) exports demonstrate refining capacity
-    - **Gems & Jewellery** ($38B) maintains traditional export strength
-    """)
+    st.success(_EXIM_STRENGTHS_MD)
     
-    st.error("""
-    **⚠️ Vulnerabilities:**
-    - **Crude Oil** ($162.2B) imports create massive trade deficit and currency pressure
-    - **Electronic Goods** show dual nature: $73.5B imports vs $23.5B exports (net importer)
-    - **Gold** ($35B) imports for cultural/investment demand strain foreign reserves
-    """)
+    st.error(_EXIM_VULN_MD)
     
     # 4.7 Policy Implications
-    st.warning("""
-    **🏛️ Policy Implications & Strategic Priorities:**
-    
-    1. **Energy Security Crisis:**
-       - Crude oil imports ($162.2B) are the single largest trade burden
-       - **Action needed:** Accelerate renewable energy adoption, electric vehicle transition
-       - Target: Reduce oil import dependency by 30% by 2030
-    
-    2. **Electronics Manufacturing Opportunity:**
-       - Current net import of $50B in electronic goods
-       - **PLI Scheme Impact:** Growing domestic assembly (phones, semiconductors)
-       - **Goal:** Achieve electronics trade balance by 2027
-    
-    3. **Value Addition Strategy:**
-       - Export petroleum products ($94.5B) while importing crude ($162.2B)
-       - **Opportunity:** Expand refining capacity, petrochemical exports
-       - Leverage engineering goods strength for high-value manufacturing
-    
-    4. **Current Account Management:**
-       - Trade deficit of $32B requires careful monitoring
-       - **Balance through:** Services exports (IT, consulting), remittances
-       - Maintain adequate foreign exchange reserves
-    """)
+    st.warning(_EXIM_POLICY_MD)
     
     # 4.8 Show detailed data
     with st.expander("📋 View Detailed Trade Data"):
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("**Import Details:**")
-            st.dataframe(imports[['Category', 'Value']].sort_values('Value', ascending=False), use_container_width=True)
+            st.dataframe(imp_sorted[['Category', 'Value']], use_container_width=True)
         with col2:
             st.markdown("**Export Details:**")
-            st.dataframe(exports[['Category', 'Value']].sort_values('Value', ascending=False), use_container_width=True)
+            st.dataframe(exp_sorted[['Category', 'Value']], use_container_width=True)
 
     # 5. DATA SOURCES (UPDATED TABLE NUMBERS)
     with st.expander("📊 View Data Sources (Click to Open)"):
-        st.markdown("""
-        **Data sourced from Reserve Bank of India (RBI):**
-        *   **Source Portal:** [RBI Database on Indian Economy (DBIE)](https://cims.rbi.org.in/)
-        *   **Specific Report:** Handbook of Statistics on the Indian Economy.
-        *   **Tables Used:** 
-            *   **Table 116:** Exports of Major Commodities.
-            *   **Table 118:** Imports of Major Commodities.
-        """)
+        st.markdown(_EXIM_SOURCES_MD)
 
 # --- MAIN EXECUTION ---
+# Manual reload path: re-read this app's data sources. Stored figures notice
+# the new data through their fingerprint, so session state needs no cleanup.
+if refresh:
+    _fetch_phillips_data.clear()
+    _load_rbi_data.clear()
+
 if page == "Real-Time Phillips Curve":
     real_phillips_curve()
 elif page == "EXIM Trade Pulse":